@@ -57,10 +57,7 @@ def categorize_description(
     category = str(data.get("category") or "").strip()
     if not category:
         raise AiError("Model returned empty category.")
-    tags = data.get("tags") or []
-    if isinstance(tags, str):
-        tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
-    tags = [str(tag).strip() for tag in tags if str(tag).strip()]
+    tags = _clean_string_list(data.get("tags"))
     confidence = data.get("confidence")
     if confidence is not None:
         try:
@@ -108,13 +105,18 @@ def suggest_categories(
     )
     content = response.output_text
     data = _parse_json(content)
-    categories = data.get("categories") or []
-    if isinstance(categories, str):
-        categories = [cat.strip() for cat in categories.split(",") if cat.strip()]
-    categories = [str(cat).strip() for cat in categories if str(cat).strip()]
+    categories = _clean_string_list(data.get("categories"))
     return AiCategorySuggestions(categories=categories[: max(1, top)])
 
 
+def _clean_string_list(values: object) -> list[str]:
+    if not values:
+        return []
+    if isinstance(values, str):
+        values = values.split(",")
+    return [item for item in (str(value).strip() for value in values) if item]
+
+
 def _parse_json(text: str) -> dict:
     text = text.strip()
     try:
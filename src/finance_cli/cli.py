@@ -642,9 +642,12 @@ def _print_suggestions(
         typer.echo(f"{idx}. {category} (score={score:.2f}, count={count})")
 
 
+_NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9]+")
+
+
 def _normalize_similarity_text(value: str) -> str:
     cleaned = value.strip().lower()
-    cleaned = re.sub(r"[^a-z0-9]+", "", cleaned)
+    cleaned = _NON_ALNUM_PATTERN.sub("", cleaned)
     return cleaned
 
 
@@ -7,11 +7,14 @@ import sqlite3
 import unicodedata
 from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable
 from urllib.parse import urlparse
 
+from finance_cli.utils import COMBINING_MARKS
+
 EN_US_MONTH_ABBREVIATIONS = [
     "JAN",
     "FEB",
@@ -26,6 +29,9 @@ EN_US_MONTH_ABBREVIATIONS = [
     "NOV",
     "DEC",
 ]
+_MONTH_ABBREVIATIONS_BY_NUMBER = {
+    f"{number:02d}": abbrev for number, abbrev in enumerate(EN_US_MONTH_ABBREVIATIONS, start=1)
+}
 
 
 @dataclass(frozen=True)
@@ -128,15 +134,9 @@ def import_csv(
     inserted = 0
     skipped = 0
 
-    with csv_path.open("r", newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
-        rows = list(reader)
-
-    if not rows:
-        return ImportResult(inserted=0, skipped=0)
-
-    with connect_db(db_value) as conn:
-        for row in rows:
+    # Stream rows straight from the file instead of loading the whole CSV first
+    with csv_path.open("r", newline="", encoding="utf-8") as csvfile, connect_db(db_value) as conn:
+        for row in csv.DictReader(csvfile):
             normalized = _normalize_row(row)
             txn_date = _parse_date(normalized.transaction_date)
             if txn_date is None:
@@ -760,27 +760,35 @@ def _normalize_row(row: dict[str, str | None]) -> NormalizedRow:
     )
 
 
+_INSTALLMENT_WORD_PATTERN = re.compile(r"\b(?:parc|parcela|parcelado|parcelamento)\b")
+_GLUED_SLASH_INSTALLMENT_PATTERN = re.compile(r"\b\w+\d{1,2}\s*/\s*\d{1,2}\b")
+_GLUED_SPACE_INSTALLMENT_PATTERN = re.compile(r"\b\w+\d{1,2}\s+\d{1,2}\b")
+_INSTALLMENT_PATTERN = re.compile(r"\b\d{1,2}\s*/\s*\d{1,2}\b")
+_PUNCTUATION_PATTERN = re.compile(r"[^\w\s]")
+_SPACED_LETTER_PATTERN = re.compile(r"\b([a-z])\s+(?=[a-z]\b)")
+
+
 def canonicalize_description(value: str) -> str:
     cleaned = value.strip().lower()
-    cleaned = unicodedata.normalize("NFKD", cleaned)
-    cleaned = "".join(
-        char for char in cleaned if not unicodedata.combining(char)
-    )
-    cleaned = re.sub(r"\b(?:parc|parcela|parcelado|parcelamento)\b", " ", cleaned)
-    cleaned = re.sub(r"\b\w+\d{1,2}\s*/\s*\d{1,2}\b", " ", cleaned)
-    cleaned = re.sub(r"\b\w+\d{1,2}\s+\d{1,2}\b", " ", cleaned)
-    cleaned = re.sub(r"\b\d{1,2}\s*/\s*\d{1,2}\b", " ", cleaned)
-    cleaned = re.sub(r"[^\w\s]", " ", cleaned)
-    cleaned = re.sub(r"\s+", " ", cleaned)
+    cleaned = unicodedata.normalize("NFKD", cleaned).translate(COMBINING_MARKS)
+    cleaned = _INSTALLMENT_WORD_PATTERN.sub(" ", cleaned)
+    cleaned = _GLUED_SLASH_INSTALLMENT_PATTERN.sub(" ", cleaned)
+    cleaned = _GLUED_SPACE_INSTALLMENT_PATTERN.sub(" ", cleaned)
+    cleaned = _INSTALLMENT_PATTERN.sub(" ", cleaned)
+    cleaned = _PUNCTUATION_PATTERN.sub(" ", cleaned)
+    cleaned = " ".join(cleaned.split())
     previous = None
     while cleaned != previous:
         previous = cleaned
-        cleaned = re.sub(r"\b([a-z])\s+(?=[a-z]\b)", r"\1", cleaned)
+        cleaned = _SPACED_LETTER_PATTERN.sub(r"\1", cleaned)
     return cleaned.strip()
 
 
+@lru_cache(maxsize=4096)
 def _parse_date(value: str) -> str | None:
     value = value.strip()
+    if (fast := _parse_date_fast(value)) is not None:
+        return fast
     formats = [
         "%d/%m/%Y",
         "%d/%m/%y",
@@ -796,6 +804,30 @@ def _parse_date(value: str) -> str | None:
     return None
 
 
+def _parse_date_fast(value: str) -> str | None:
+    # Slicing shortcut for DD/MM/YYYY, DD/MM/YY and ISO dates, the layouts the importers
+    # write. Anything else (or an invalid DD/MM that may be MM/DD) falls back to strptime.
+    if len(value) in (8, 10) and value[2] == value[5] == "/":
+        day, month, year = value[:2], value[3:5], value[6:]
+    elif len(value) == 10 and value[4] == value[7] == "-":
+        year, month, day = value[:4], value[5:7], value[8:]
+    else:
+        return None
+    digits = day + month + year
+    if not (digits.isascii() and digits.isdigit()):
+        return None
+    year_value = int(year)
+    if len(year) == 2:
+        # Same pivot as strptime's %y
+        year_value += 2000 if year_value < 69 else 1900
+    elif year_value < 1000:
+        return None
+    try:
+        return date(year_value, int(month), int(day)).isoformat()
+    except ValueError:
+        return None
+
+
 def _parse_amount_cents(value: str) -> int:
     cleaned = value.strip().replace(" ", "")
     if "," in cleaned and "." in cleaned:
@@ -813,13 +845,13 @@ def _itau_import_id(payment_date: str, index: str) -> str:
     parsed = _parse_date(payment_date)
     if parsed is None:
         raise ValueError(f"Invalid payment date for Itaú import: {payment_date}")
-    year, month, _ = parsed.split("-", 2)
     try:
         index_value = int(index)
     except ValueError as exc:
         raise ValueError(f"Invalid index for Itaú import: {index}") from exc
-    month_abbrev = EN_US_MONTH_ABBREVIATIONS[int(month) - 1]
-    return f"{year}-{month_abbrev}-{index_value}"
+    # parsed is always YYYY-MM-DD
+    month_abbrev = _MONTH_ABBREVIATIONS_BY_NUMBER[parsed[5:7]]
+    return f"{parsed[:4]}-{month_abbrev}-{index_value}"
 
 
 def _hash_import_id(
@@ -4,12 +4,11 @@ from pathlib import Path
 import fitz
 import typer
 
-from finance_cli.cli import resolve_itau_inputs
-from finance_cli.itau import get_pdf_text
+from finance_cli.utils import resolve_itau_inputs
 from itau_pdf.debug import annotate_pdf
 from itau_pdf.layout import iter_lines
 from itau_pdf import metadata
-from itau_pdf.statements import parse_lines, add_id, flip_sign, add_year
+from itau_pdf.statements import parse_lines
 from itau_pdf.utils import normalize_text
 
 app = typer.Typer(help="Debug entrypoint for personal finance CLI.")
@@ -29,30 +28,29 @@ def debug_itau_pdf(
         if len(pdf_paths) > 1:
             outputs.append(f"=== {pdf_path} ===")
 
-        # 1. Raw Text
-        raw_text = get_pdf_text(str(pdf_path))
-        outputs.append("--- RAW TEXT ---")
-        outputs.append(raw_text)
-
-        # 2. Normalized Text
-        norm_text = normalize_text(raw_text)
-        outputs.append("\n--- NORMALIZED TEXT ---")
-        outputs.append(norm_text)
-
-        # 3. Metadata
-        outputs.append("\n--- METADATA ---")
-        card_last4 = metadata._extract_last4(raw_text)
-        stmt_total = metadata._extract_total(raw_text)
-        payment_date = metadata._extract_payment_date(raw_text)
-        issue_date = metadata._extract_issue_date(raw_text)
-        outputs.append(f"Card Last 4: {card_last4}")
-        outputs.append(f"Total: {stmt_total}")
-        outputs.append(f"Payment Date: {payment_date}")
-        outputs.append(f"Issue Date: {issue_date}")
-
-
-
+        # Open once and share the document across text, lines and annotation
         with fitz.open(pdf_path) as doc:
+            # 1. Raw Text
+            raw_text = "\n".join(page.get_text() for page in doc)
+            outputs.append("--- RAW TEXT ---")
+            outputs.append(raw_text)
+
+            # 2. Normalized Text
+            norm_text = normalize_text(raw_text)
+            outputs.append("\n--- NORMALIZED TEXT ---")
+            outputs.append(norm_text)
+
+            # 3. Metadata
+            outputs.append("\n--- METADATA ---")
+            card_last4 = metadata._extract_last4(raw_text)
+            stmt_total = metadata._extract_total(raw_text)
+            payment_date = metadata._extract_payment_date(raw_text)
+            issue_date = metadata._extract_issue_date(raw_text)
+            outputs.append(f"Card Last 4: {card_last4}")
+            outputs.append(f"Total: {stmt_total}")
+            outputs.append(f"Payment Date: {payment_date}")
+            outputs.append(f"Issue Date: {issue_date}")
+
             # 4. Lines (using new layout logic)
             outputs.append("\n--- LINES ---")
             for line in iter_lines(doc):
@@ -63,15 +61,12 @@ def debug_itau_pdf(
 
             # 5. Statements
             outputs.append("\n--- STATEMENTS ---")
-            for statement in add_year(add_id(flip_sign(parse_lines(iter_lines(doc))), payment_date), issue_date):
+            for statement in parse_lines(iter_lines(doc), payment_date):
                 outputs.append(
                     f"{statement.id} / {statement.date} / {statement.description} / {statement.amount} / {statement.category} / {statement.location or "-"}"
                 )
 
-
-
-
-        annotate_pdf(str(pdf_path))
+            annotate_pdf(str(pdf_path), doc=doc)
 
     debug_output = "\n".join(outputs)
     if output is None:
@@ -1,16 +1,23 @@
 from __future__ import annotations
 
 import csv
+import io
+import math
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, TextIO
 
 CSV_HEADERS = ["id", "transaction_date", "payment_date", "description", "amount", "acc"]
+# csv.writer's default, kept so appends match files written before rows were written raw
+_LINE_TERMINATOR = "\r\n"
+# Characters csv.writer would quote; rows containing them still go through it
+_QUOTED_CHARS = ('"', "\r", "\n")
 
 
 # this is definitely control flow, not lib
 def check_total(csv_data: Iterable[str], expected_total: float) -> None:
     try:
-        total_sum = sum(float(row.split(",")[4]) for row in csv_data)
+        # amount is the 5th column; don't split trailing optional columns
+        total_sum = math.fsum(float(row.split(",", 5)[4]) for row in csv_data)
         if round(total_sum, 2) != round(expected_total, 2):
             raise ValueError(f"Total mismatch: expected {expected_total:.2f}, got {total_sum:.2f}")
     except (IndexError, ValueError) as exc:
@@ -22,24 +29,39 @@ def check_total(csv_data: Iterable[str], expected_total: float) -> None:
 def write_csv_lines_idempotent(rows: Iterable[str], output_path: Path, include_headers: bool = True,
                                headers: list[str] | None = None) -> int:
     headers = headers or CSV_HEADERS
-    existing_ids = set()
-    if output_path.exists():
-        with output_path.open("r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            if reader.fieldnames:
-                existing_ids = {r["id"] for r in reader if "id" in r}
+    output_path.parent.mkdir(parents=True, exist_ok=True)
 
     added = 0
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    mode = "a" if output_path.exists() else "w"
-    with output_path.open(mode, newline="", encoding="utf-8") as f:
+    # One handle for both reading existing ids and appending; "a+" starts at the end
+    with output_path.open("a+", newline="", encoding="utf-8") as f:
+        is_empty = f.tell() == 0
+        f.seek(0)
+        existing_ids = _read_existing_ids(f, headers)
+
         writer = csv.writer(f)
-        if mode == "w" and include_headers:
-            writer.writerow(headers)
+        if is_empty and include_headers:
+            f.write(",".join(headers) + _LINE_TERMINATOR)
         for row in rows:
-            parts = row.split(",")
-            if parts[0] not in existing_ids:
-                writer.writerow(parts)
-                existing_ids.add(parts[0])
+            row_id = row.partition(",")[0]
+            if row_id not in existing_ids:
+                if any(char in row for char in _QUOTED_CHARS):
+                    writer.writerow(row.split(","))
+                else:
+                    f.write(row + _LINE_TERMINATOR)
+                existing_ids.add(row_id)
                 added += 1
     return added
+
+
+def _read_existing_ids(f: TextIO, headers: list[str]) -> set[str]:
+    """Ids (first field) of the rows already in the file, excluding a header row."""
+    content = f.read()
+    if '"' in content:
+        # Rows with _QUOTED_CHARS went through csv.writer and may span lines, so parse properly
+        first_fields = [record[0] for record in csv.reader(io.StringIO(content)) if record]
+    else:
+        # Every row was written raw, so the id is everything before the first comma
+        first_fields = [line.partition(",")[0] for line in content.split("\n") if line]
+    if content.partition("\n")[0].rstrip("\r") == ",".join(headers):
+        first_fields = first_fields[1:]
+    return set(first_fields)
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
 import os
+import random
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import lru_cache
+from typing import Any
 
-from notion_client import Client
+from notion_client import APIResponseError, Client
+
+# Notion allows an average of 3 requests per second per integration
+_MAX_CONCURRENT_REQUESTS = 3
+_REQUESTS_PER_SECOND = 3.0
+_REQUEST_BURST = 5
+_MAX_ATTEMPTS = 5
 
 
 @dataclass(frozen=True)
@@ -30,11 +42,67 @@ def _get_notion_client() -> Client:
     return Client(auth=config.token)
 
 
+class _RateLimiter:
+    """Token bucket shared by all Notion calls, including batch worker threads."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self._rate = rate
+        self._burst = burst
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Blocks until a request token is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                refill = (now - self._last_refill) * self._rate
+                self._tokens = min(self._burst, self._tokens + refill)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self._rate
+            time.sleep(wait)
+
+
+_rate_limiter = _RateLimiter(_REQUESTS_PER_SECOND, _REQUEST_BURST)
+
+
+def _call_notion[T](request: Callable[..., T], **kwargs: Any) -> T:
+    """
+    Runs a Notion API request under the shared rate limit.
+    Retries rate-limited (429) responses, honoring Retry-After when present.
+    """
+    attempt = 0
+    while True:
+        _rate_limiter.acquire()
+        try:
+            return request(**kwargs)
+        except APIResponseError as exc:
+            attempt += 1
+            if exc.status != 429 or attempt >= _MAX_ATTEMPTS:
+                raise
+            time.sleep(_retry_delay(exc, attempt))
+
+
+def _retry_delay(exc: APIResponseError, attempt: int) -> float:
+    """
+    Seconds to wait before retrying.
+    Uses Retry-After when sent, else exponential backoff with jitter.
+    """
+    try:
+        return float(exc.headers["Retry-After"])
+    except (KeyError, TypeError, ValueError):
+        return 2 ** attempt + random.uniform(0, 1)
+
+
 def get_notion_page(page_id: str) -> dict | None:
     """Fetch a single page by its Notion page_id."""
     notion = _get_notion_client()
     try:
-        return notion.pages.retrieve(page_id=page_id)
+        return _call_notion(notion.pages.retrieve, page_id=page_id)
     except Exception:
         return None
 
@@ -44,10 +112,17 @@ def query_notion_pages(filter_params: dict | None = None) -> list[dict]:
     Efficiently fetch pages from Notion database using a generic filter.
     Handles pagination automatically.
     """
+    return list(iter_notion_pages(filter_params))
+
+
+def iter_notion_pages(filter_params: dict | None = None) -> Iterator[dict]:
+    """
+    Lazily yield pages from the Notion database, fetching the next batch of
+    100 only when the previous one has been consumed.
+    """
     config = _get_notion_config()
     notion = _get_notion_client()
 
-    pages: list[dict] = []
     start_cursor = None
 
     while True:
@@ -57,15 +132,13 @@ def query_notion_pages(filter_params: dict | None = None) -> list[dict]:
         if filter_params:
             payload["filter"] = filter_params
 
-        result = notion.databases.query(**payload)
-        pages.extend(result.get("results", []))
+        result = _call_notion(notion.databases.query, **payload)
+        yield from result.get("results", [])
 
         if not result.get("has_more"):
             break
         start_cursor = result.get("next_cursor")
 
-    return pages
-
 
 def upsert_notion_page(page_id: str | None, properties: dict) -> str | None:
     """
@@ -94,9 +167,10 @@ def batch_upsert_pages(entries: list[tuple[str | None, dict]]) -> dict[str, int]
     updated = 0
     failed = 0
 
-    for page_id, props in entries:
-        try:
-            result_id = upsert_notion_page(page_id, props)
+    # Requests are I/O bound, so overlap round-trips; the client is thread-safe
+    with ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_REQUESTS) as executor:
+        result_ids = executor.map(_try_upsert_notion_page, entries)
+        for (page_id, _), result_id in zip(entries, result_ids, strict=True):
             if result_id:
                 if page_id is None:
                     created += 1
@@ -104,18 +178,26 @@ def batch_upsert_pages(entries: list[tuple[str | None, dict]]) -> dict[str, int]
                     updated += 1
             else:
                 failed += 1
-        except Exception:
-            failed += 1
 
     return {"created": created, "updated": updated, "failed": failed}
 
 
+def _try_upsert_notion_page(entry: tuple[str | None, dict]) -> str | None:
+    """Upserts a single (page_id, properties) entry, returning None on any failure."""
+    page_id, props = entry
+    try:
+        return upsert_notion_page(page_id, props)
+    except Exception:
+        return None
+
+
 def _create_notion_page(properties: dict) -> str | None:
     """Creates a page with the provided properties and returns the new page_id."""
     config = _get_notion_config()
     notion = _get_notion_client()
     try:
-        response = notion.pages.create(
+        response = _call_notion(
+            notion.pages.create,
             parent={"database_id": config.database_id},
             properties=properties,
         )
@@ -128,7 +210,7 @@ def _update_notion_page(page_id: str, properties: dict) -> bool:
     """Updates an existing Notion page by its id with provided properties."""
     notion = _get_notion_client()
     try:
-        notion.pages.update(page_id=page_id, properties=properties)
+        _call_notion(notion.pages.update, page_id=page_id, properties=properties)
         return True
     except Exception:
         return False
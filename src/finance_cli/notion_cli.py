@@ -3,6 +3,7 @@ from pathlib import Path
 from datetime import datetime
 import typer
 from finance_cli.notion import (
+    _call_notion,
     _get_notion_client,
     get_notion_page,
 )
@@ -24,7 +25,7 @@ def notion_search(
     """Search for a page containing the query."""
     # TODO: search should look in searchable fields according to schema config (only title is too restrictive)
     notion = _get_notion_client()
-    results = notion.search(query=query).get("results", [])
+    results = _call_notion(notion.search, query=query).get("results", [])
     if not results:
         typer.echo("No results found.")
         return
@@ -67,7 +68,7 @@ def notion_put(
         raise typer.Exit(code=1)
     
     try:
-        data = json.loads(file_path.read_text())
+        data = json.loads(file_path.read_bytes())
     except Exception as e:
         typer.echo(f"Failed to parse JSON: {e}", err=True)
         raise typer.Exit(code=1)
@@ -75,7 +76,9 @@ def notion_put(
     notion = _get_notion_client()
     
     try:
-        updated_page = notion.pages.update(page_id=page_id, properties=data.get("properties", data))
+        updated_page = _call_notion(
+            notion.pages.update, page_id=page_id, properties=data.get("properties", data)
+        )
         typer.echo(f"Successfully updated page {page_id}")
         typer.echo(json.dumps(updated_page, indent=2, default=json_serializer))
     except Exception as e:
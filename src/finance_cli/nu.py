@@ -1,12 +1,16 @@
 from __future__ import annotations
 
 from pathlib import Path
+from functools import lru_cache
+from itertools import repeat
 import hashlib
 import re
 import unicodedata
 
 import pandas as pd
 
+from finance_cli.utils import COMBINING_MARKS
+
 BASE_HEADERS = ["id", "transaction_date", "payment_date", "description", "amount"]
 
 
@@ -31,8 +35,8 @@ def parse_nubank_csv(
     template: str,
 ) -> Path:
     template = {"nubank_cc": "nu_cred", "nubank_chk": "nu_acc"}.get(template, template)
-    df = pd.read_csv(input_csv)
-    column_map = {_normalize_header(name): name for name in df.columns}
+    # Peek at the header first so only the columns we map are parsed
+    column_map = {_normalize_header(name): name for name in pd.read_csv(input_csv, nrows=0).columns}
 
     date_col = _find_column(column_map, _DATE_HEADERS)
     desc_col = _find_column(column_map, _DESC_HEADERS)
@@ -53,6 +57,16 @@ def parse_nubank_csv(
     tags_col = _find_column(column_map, _TAG_HEADERS)
     id_col = _find_column(column_map, _ID_HEADERS)
 
+    used_columns = [
+        column
+        for column in (
+            date_col, desc_col, amount_col, payment_col,
+            category_col, location_col, tags_col, id_col,
+        )
+        if column is not None
+    ]
+    df = pd.read_csv(input_csv, usecols=used_columns)
+
     dates = _parse_dates(df[date_col])
     if dates.isna().any():
         raise ValueError("Found invalid transaction dates in the CSV.")
@@ -80,15 +94,12 @@ def parse_nubank_csv(
     if id_col:
         row_ids = df[id_col].astype(str).str.strip()
     else:
+        payment_dates = payment_date if payment_date is not None else repeat(None)
         row_ids = [
-            _stable_row_id(
-                template,
-                txn_date,
-                payment_date.iloc[idx] if payment_date is not None else None,
-                descriptions.iloc[idx],
-                amounts.iloc[idx],
+            _stable_row_id(template, txn_date, pay_date, description, amount)
+            for txn_date, pay_date, description, amount in zip(
+                transaction_date, payment_dates, descriptions, amounts, strict=False
             )
-            for idx, txn_date in enumerate(transaction_date)
         ]
 
     data: dict[str, pd.Series | list[str]] = {
@@ -96,7 +107,8 @@ def parse_nubank_csv(
         "transaction_date": transaction_date,
         "payment_date": payment_date if payment_date is not None else "",
         "description": descriptions,
-        "amount": amounts.map(lambda value: f"{value:.2f}"),
+        # Formatted to 2 decimals by to_csv's float_format; cast so integer columns get it too
+        "amount": amounts.astype("float64"),
     }
 
     headers = BASE_HEADERS.copy()
@@ -111,15 +123,18 @@ def parse_nubank_csv(
         headers.append("location")
 
     output_path = output_csv or input_csv.with_name(f"{input_csv.stem}_parsed.csv")
-    pd.DataFrame(data, columns=headers).to_csv(output_path, index=False)
+    pd.DataFrame(data, columns=headers).to_csv(output_path, index=False, float_format="%.2f")
     return output_path
 
 
+_NON_ALNUM_PATTERN = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=256)
 def _normalize_header(value: str) -> str:
     cleaned = value.strip().lower()
-    cleaned = unicodedata.normalize("NFKD", cleaned)
-    cleaned = "".join(char for char in cleaned if not unicodedata.combining(char))
-    cleaned = re.sub(r"[^a-z0-9]+", "", cleaned)
+    cleaned = unicodedata.normalize("NFKD", cleaned).translate(COMBINING_MARKS)
+    cleaned = _NON_ALNUM_PATTERN.sub("", cleaned)
     return cleaned
 
 
@@ -133,7 +148,15 @@ def _find_column(
     return None
 
 
+_DATE_FORMATS = ("%d/%m/%Y", "%Y-%m-%d")
+
+
 def _parse_dates(series: pd.Series) -> pd.Series:
+    # Nubank exports use one of these layouts; an explicit format skips per-value inference
+    for date_format in _DATE_FORMATS:
+        parsed = pd.to_datetime(series, errors="coerce", format=date_format)
+        if not parsed.isna().any():
+            return parsed
     return pd.to_datetime(series, errors="coerce", dayfirst=True)
 
 
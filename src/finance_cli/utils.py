@@ -1,18 +1,44 @@
 import glob
+import os
+import unicodedata
 from pathlib import Path
 
 
 def resolve_itau_inputs(input_path: str) -> list[Path]:
     if any(char in input_path for char in ["*", "?", "["]):
         matches = [Path(path) for path in glob.glob(input_path)]
+        pdfs = _filter_pdfs(matches)
     else:
         path = Path(input_path)
         if path.is_dir():
-            matches = sorted(path.glob("*.pdf"))
+            # DirEntry.is_file() reuses the file type from the directory listing, no extra stat
+            with os.scandir(path) as entries:
+                pdfs = sorted(
+                    Path(entry.path) for entry in entries
+                    if entry.name.endswith(".pdf") and entry.is_file()
+                )
         else:
-            matches = [path]
+            pdfs = _filter_pdfs([path])
 
-    pdfs = [path for path in matches if path.is_file() and path.suffix.lower() == ".pdf"]
     if not pdfs:
         raise ValueError(f"No PDF files found for input: {input_path}")
     return pdfs
+
+
+def _filter_pdfs(paths: list[Path]) -> list[Path]:
+    return [path for path in paths if path.is_file() and path.suffix.lower() == ".pdf"]
+
+
+class _CombiningMarks(dict):
+    """
+    str.translate table deleting every code point unicodedata.combining() flags.
+    Filled on lookup, one code point at a time, so importing it costs nothing.
+    """
+
+    def __missing__(self, code: int) -> int | None:
+        value = None if unicodedata.combining(chr(code)) else code
+        self[code] = value
+        return value
+
+
+COMBINING_MARKS = _CombiningMarks()
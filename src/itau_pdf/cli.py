@@ -1,3 +1,7 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 import fitz
 import typer
 from rich.console import Console
@@ -15,7 +19,9 @@ console = Console()
 def _process_pdf(pdf_path: Path):
     """Internal helper to parse PDF and return (meta, statements, statement_sum)."""
     with fitz.open(pdf_path) as doc:
-        raw_text = "\n".join([page.get_text() for page in doc])
+        # Build each page's TextPage once and share it between raw text and layout words
+        pages = [(page, page.get_textpage(flags=fitz.TEXTFLAGS_TEXT)) for page in doc]
+        raw_text = "\n".join([textpage.extractText() for _, textpage in pages])
         meta = metadata.get_metadata(raw_text)
 
         # Validate Metadata fields
@@ -24,11 +30,15 @@ def _process_pdf(pdf_path: Path):
             raise ValueError(f"Missing metadata: {', '.join(missing)}")
 
         # Parse Statements
-        statements = list(parse_lines(iter_lines(doc), meta.payment_date))
-        statement_sum = sum(s.amount for s in statements)
+        statements = list(parse_lines(iter_lines(pages), meta.payment_date))
+        statement_sum = math.fsum(s.amount for s in statements)
         
         return meta, statements, statement_sum
 
+def _totals_match(statement_sum: float, total: float) -> bool:
+    """Statements are debits (negative), so they should cancel the total to the cent."""
+    return abs(statement_sum + total) < 0.005
+
 @app.command("check")
 def check_pdfs(
     glob_pattern: str = typer.Argument(..., help="Glob pattern for Itaú PDFs (e.g. 'faturas/*.pdf')."),
@@ -41,12 +51,20 @@ def check_pdfs(
     table.add_column("Status")
     table.add_column("Details")
 
-    for pdf_path in pdf_paths:
+    # Each PDF is independent CPU-bound work (PyMuPDF is not thread-safe), so use processes;
+    # a single PDF is parsed inline instead of starting workers for it
+    if len(pdf_paths) > 1:
+        with ProcessPoolExecutor() as executor:
+            pending = [executor.submit(_process_pdf, p).result for p in pdf_paths]
+    else:
+        pending = [partial(_process_pdf, p) for p in pdf_paths]
+
+    for pdf_path, get_result in zip(pdf_paths, pending, strict=True):
         try:
-            meta, statements, stmt_sum = _process_pdf(pdf_path)
+            meta, statements, stmt_sum = get_result()
             
             # Check sum
-            if round(stmt_sum, 2) != -round(meta.total, 2):
+            if not _totals_match(stmt_sum, meta.total):
                 diff = abs(meta.total + stmt_sum)
                 table.add_row(
                     pdf_path.name, 
@@ -83,7 +101,7 @@ def parse_pdf(
         f"[green]Metadata loaded:[/green] Card: {meta.last4} | Total: R$ {meta.total:.2f} | Due: {meta.payment_date}")
 
     # 4. Validate Sum
-    if round(statement_sum, 2) != -round(meta.total, 2):
+    if not _totals_match(statement_sum, meta.total):
         console.print(
             f"[red]Error: Metadata total (R$ {meta.total:.2f}) does not match statement sum (R$ {statement_sum:.2f}) - Difference: R$ {abs(meta.total - statement_sum):.2f}[/red]")
         raise typer.Exit(1)
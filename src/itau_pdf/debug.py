@@ -1,15 +1,18 @@
 import fitz
 
-from finance_cli.itau import get_pdf_text
 from itau_pdf.layout import _iter_pages, _iter_lines, _has_marker
-from itau_pdf.metadata import _extract_issue_date
 
 
-def annotate_pdf(pdf_path: str, output_path: str | None = None) -> None:
-    """Annotate PDF with x split and block coordinates."""
-    doc = fitz.open(pdf_path)
-    text = get_pdf_text(pdf_path)
-    issue_date = _extract_issue_date(text)
+def annotate_pdf(
+    pdf_path: str, output_path: str | None = None, doc: fitz.Document | None = None
+) -> None:
+    """
+    Annotate PDF with x split and block coordinates.
+    Pass an already-open doc to draw on it instead of opening pdf_path again.
+    """
+    owns_doc = doc is None
+    if owns_doc:
+        doc = fitz.open(pdf_path)
     start_marker = False
     for page in _iter_pages(doc):
         page_rect = page.pdf.rect
@@ -50,4 +53,5 @@ def annotate_pdf(pdf_path: str, output_path: str | None = None) -> None:
                 color=color,
             )
     doc.save(output_path or pdf_path[:-4] + ".annotated.pdf")
-    doc.close()
+    if owns_doc:
+        doc.close()
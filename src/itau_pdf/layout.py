@@ -1,6 +1,8 @@
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from enum import Enum
-from typing import Iterator, Literal, List
+from operator import attrgetter
+from typing import List, Literal
 
 import fitz
 
@@ -10,11 +12,13 @@ from itau_pdf.utils import normalize_text
 # Layout module goal: parse PDF, emit lines in flipped N order from start to stop marker
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Page:
     index: int
     pdf: fitz.Page
     x_split: float
+    # Reused for word extraction when the caller already built it for raw text
+    textpage: fitz.TextPage | None = None
 
 
 class Column(str, Enum):
@@ -22,7 +26,7 @@ class Column(str, Enum):
     right = "right"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Word:
     x0: float
     y0: float
@@ -31,7 +35,7 @@ class Word:
     text: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Line:
     """A line of text enriched with layout metadata."""
     text: str = ""
@@ -44,10 +48,14 @@ class Line:
     y1: float = 0.0
 
 
-def iter_lines(doc: fitz.Document) -> Iterator[Line]:
-    """Yield lines in flipped N order from start to stop marker."""
+def iter_lines(pages: Iterable[fitz.Page | tuple[fitz.Page, fitz.TextPage]]) -> Iterator[Line]:
+    """
+    Yield lines in flipped N order from start to stop marker.
+    pages is a document, or (page, textpage) pairs when the caller already built
+    each page's TextPage, so words are read without a second content-stream parse.
+    """
     start_marker = False
-    for page in _iter_pages(doc):
+    for page in _iter_pages(pages):
         for line in _iter_lines(page):
             if not start_marker and _has_marker(line, "start"):
                 start_marker = True
@@ -71,11 +79,13 @@ def _has_marker(line: Line, marker: Literal["start", "stop"]) -> bool:
 
 # ---------- PAGES ----------
 
-def _iter_pages(doc: fitz.Document) -> Iterator[Page]:
+def _iter_pages(pages: Iterable[fitz.Page | tuple[fitz.Page, fitz.TextPage]]) -> Iterator[Page]:
     """Yield pages with an x-split coordinate based on the layout."""
-    for page in doc:
+    for item in pages:
+        # A TextPage only works with the page object it was built from, so they travel together
+        page, textpage = item if isinstance(item, tuple) else (item, None)
         x_split = _calc_x_plit(page)
-        yield Page(page.number + 1, page, x_split)
+        yield Page(page.number + 1, page, x_split, textpage)
 
 
 def _calc_x_plit(page: fitz.Page) -> float:
@@ -103,11 +113,14 @@ def _iter_lines(page: Page) -> Iterator[Line] | None:
 
 def _split_columns(page: Page) -> dict[Column, list[Line]] | None:
     """Group words into left/right columns based on x_split."""
-    if not (words := [Word(*w[:5]) for w in page.pdf.get_text("words")]):
+    if not (raw_words := page.pdf.get_text("words", textpage=page.textpage)):
         return None
 
-    left_words = [w for w in words if w.x0 < page.x_split]
-    right_words = [w for w in words if w.x0 >= page.x_split]
+    left_words: list[Word] = []
+    right_words: list[Word] = []
+    x_split = page.x_split
+    for w in raw_words:
+        (left_words if w[0] < x_split else right_words).append(Word(*w[:5]))
 
     return {
         Column.left: _group_words(left_words),
@@ -121,37 +134,32 @@ def _group_words(words: List[Word], y_tol: float | None = None) -> List[Line]:
         return []
 
     y_tol = y_tol or _calc_y_tol(words)
-    words_sorted = sorted(words, key=lambda w: (w.y0, w.x0))
 
     # 1st pass - decide which words belong on the same line
-    raw_lines: List[dict] = []
-    for word in words_sorted:
-        if not raw_lines or abs(word.y0 - raw_lines[-1]["y0"]) > y_tol:
-            raw_lines.append(
-                {
-                    "y0": word.y0,
-                    "y1": word.y1,
-                    "words": [word],
-                }
-            )
+    groups: list[list[Word]] = []
+    line_y0 = 0.0
+    for word in sorted(words, key=attrgetter("y0", "x0")):
+        # Sorted by y0, so the first word of a line has its smallest y0
+        if groups and word.y0 - line_y0 <= y_tol:
+            groups[-1].append(word)
         else:
-            raw_lines[-1]["y0"] = min(raw_lines[-1]["y0"], word.y0)
-            raw_lines[-1]["y1"] = max(raw_lines[-1]["y1"], word.y1)
-            raw_lines[-1]["words"].append(word)
+            groups.append([word])
+            line_y0 = word.y0
 
     # 2nd pass - order words in line (turn into readable text)
     result: List[Line] = []
-    for line_data in raw_lines:
-        words_in_line = sorted(line_data["words"], key=lambda w: w.x0)
-        text = " ".join(w.text for w in words_in_line).strip()
+    for group in groups:
+        y0 = group[0].y0
+        group.sort(key=attrgetter("x0"))
+        text = " ".join(w.text for w in group).strip()
         if not text:
             continue
 
         result.append(Line(
-            y0=line_data["y0"],
-            y1=line_data["y1"],
-            x0=words_in_line[0].x0,
-            x1=words_in_line[-1].x1,
+            y0=y0,
+            y1=max(w.y1 for w in group),
+            x0=group[0].x0,
+            x1=group[-1].x1,
             text=text,
             column=Column.left,
             page=1
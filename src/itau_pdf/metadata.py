@@ -1,9 +1,26 @@
 import re
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, date
 
 from itau_pdf.utils import parse_brl_amount
 
+_LAST4_PATTERN = re.compile(r"x{4}\.(\d{4})", re.IGNORECASE)
+# Alternatives in priority order, each with one capture group, so match.lastindex is the priority
+_TOTAL_PATTERN = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r"total\s+desta\s+fatura\s*\n\s*(?:r\$)?\s*([\d\.]+,\d{2})",
+            r"o\s+total\s+da\s+sua\s+fatura\s+é:\s*\n?\s*r\$\s*([\d\.]+,\d{2})",
+            r"total\s+da\s+fatura(?!\s+anterior)\s*\n?\s*(?:r\$)?\s*([\d\.]+,\d{2})",
+        )
+    ),
+    re.IGNORECASE | re.MULTILINE,
+)
+_PAYMENT_DATE_PATTERN = re.compile(r"vencimento\D*(\d{2}/\d{2}/\d{4})", re.IGNORECASE)
+_ISSUE_DATE_PATTERN = re.compile(r"emiss[aã]o:?\s*(\d{2}/\d{2}/\d{4})", re.IGNORECASE)
+
 
 @dataclass(frozen=True)
 class Metadata:
@@ -24,27 +41,29 @@ def get_metadata(pdf_text: str) -> Metadata:
 
 def _extract_last4(pdf_text: str) -> str | None:
     """Extract the last 4 digits of the card from the PDF text (XXXX.1234)."""
-    if masked_match := re.findall(r"x{4}\.(\d{4})", pdf_text, flags=re.IGNORECASE):
-        return masked_match[-1]
+    # Only the last match is needed, so keep one instead of building findall's list
+    if last_match := deque(_LAST4_PATTERN.finditer(pdf_text), maxlen=1):
+        return last_match[0].group(1)
     return None
 
 
 def _extract_total(text: str) -> float | None:
     """Find the statement total in raw or normalized PDF text."""
-    total_patterns = (
-        r"total\s+desta\s+fatura\s*\n\s*(?:r\$)?\s*([\d\.]+,\d{2})",
-        r"o\s+total\s+da\s+sua\s+fatura\s+é:\s*\n?\s*r\$\s*([\d\.]+,\d{2})",
-        r"total\s+da\s+fatura(?!\s+anterior)\s*\n?\s*(?:r\$)?\s*([\d\.]+,\d{2})",
-    )
-    for pattern in total_patterns:
-        if match := re.search(pattern, text, flags=re.IGNORECASE | re.MULTILINE):
-            return parse_brl_amount(match.group(1))
-    return None
+    # One scan over the text; keep the highest-priority alternative seen
+    best = None
+    for match in _TOTAL_PATTERN.finditer(text):
+        if best is None or match.lastindex < best.lastindex:
+            best = match
+            if best.lastindex == 1:
+                break
+    if best is None:
+        return None
+    return parse_brl_amount(best.group(best.lastindex))
 
 
 def _extract_payment_date(text: str) -> date | None:
     """Extract the invoice payment date after "vencimento"."""
-    if not (match := re.search(r"vencimento\D*(\d{2}/\d{2}/\d{4})", text, re.IGNORECASE)):
+    if not (match := _PAYMENT_DATE_PATTERN.search(text)):
         return None
     try:
         return datetime.strptime(match.group(1), "%d/%m/%Y").date()
@@ -54,7 +73,7 @@ def _extract_payment_date(text: str) -> date | None:
 
 def _extract_issue_date(text: str) -> date | None:
     """Extract the invoice issue date after "emissão"."""
-    if not (match := re.search(r"emiss[aã]o:?\s*(\d{2}/\d{2}/\d{4})", text, re.IGNORECASE)):
+    if not (match := _ISSUE_DATE_PATTERN.search(text)):
         return None
     try:
         return datetime.strptime(match.group(1), "%d/%m/%Y").date()
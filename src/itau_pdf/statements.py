@@ -1,11 +1,15 @@
 import re
 from dataclasses import dataclass
-from datetime import date, datetime
+from datetime import date
 from typing import Iterator
 
 from itau_pdf.layout import Line
 from itau_pdf.utils import parse_brl_amount
 
+_FIRST_LINE_PATTERN = re.compile(
+    r"^(\d{2}/\d{2})\s+(.+?)\s+((?:-\s?)?[\d.]+,\d{2})$", re.IGNORECASE
+)
+
 
 @dataclass(frozen=True)
 class Statement:
@@ -17,6 +21,22 @@ class Statement:
     location: str = ""
 
 
+@dataclass(slots=True)
+class _StatementDraft:
+    """Mutable statement being assembled across its two lines."""
+    id: str
+    date: date
+    description: str
+    amount: float
+    category: str = ""
+    location: str = ""
+
+    def build(self) -> Statement:
+        return Statement(
+            self.id, self.date, self.description, self.amount, self.category, self.location
+        )
+
+
 def parse_lines(lines: Iterator[Line], payment_date: date) -> Iterator[Statement]:
     """
     Parses lines into statements. Lines may not be consecutive.
@@ -24,7 +44,8 @@ def parse_lines(lines: Iterator[Line], payment_date: date) -> Iterator[Statement
     Line 2: <category> . <location> (or just <category>)
     """
     index = 1
-    current_stmt: dict | None = None
+    id_prefix = payment_date.strftime("%Y-%b")
+    current_stmt: _StatementDraft | None = None
     for line in lines:
         text = line.text.strip()
         if not text:
@@ -33,17 +54,16 @@ def parse_lines(lines: Iterator[Line], payment_date: date) -> Iterator[Statement
         # 1. Match Line 1: Date, Description, Amount
         # Handles: "23/01 AMAZON*MARKETPLACE 02/08 -170,00" or "15/02 IFOOD 42,50"
         # Regex: date (DD/MM), then anything (description), then BRL amount
-        if first_line_match := re.match(r"^(\d{2}/\d{2})\s+(.+?)\s+((?:-\s?)?[\d.]+,\d{2})$", text, re.IGNORECASE):
+        # Cheap DD/ check first so category lines skip the regex entirely
+        if _could_start_statement(text) and (first_line_match := _FIRST_LINE_PATTERN.match(text)):
             if current_stmt:
-                yield Statement(**current_stmt)
-            current_stmt = {
-                "id": f"{payment_date.strftime("%Y-%b")}-{index:03d}",
-                "date": _parse_date(first_line_match.group(1), payment_date),
-                "description": first_line_match.group(2).strip(),
-                "amount": -parse_brl_amount(first_line_match.group(3)),
-                "category": "",
-                "location": "",
-            }
+                yield current_stmt.build()
+            current_stmt = _StatementDraft(
+                id=f"{id_prefix}-{index:03d}",
+                date=_parse_date(first_line_match.group(1), payment_date),
+                description=first_line_match.group(2).strip(),
+                amount=-parse_brl_amount(first_line_match.group(3)),
+            )
             index += 1
             continue
 
@@ -52,20 +72,27 @@ def parse_lines(lines: Iterator[Line], payment_date: date) -> Iterator[Statement
         if current_stmt:
             if "." in text:
                 parts = text.split(".", 1)
-                current_stmt["category"] = parts[0].strip()
-                current_stmt["location"] = parts[1].strip()
+                current_stmt.category = parts[0].strip()
+                current_stmt.location = parts[1].strip()
             else:
-                current_stmt["category"] = text
-            yield Statement(**current_stmt)
+                current_stmt.category = text
+            yield current_stmt.build()
             current_stmt = None
 
     if current_stmt:
-        yield Statement(**current_stmt)
+        yield current_stmt.build()
+
+
+def _could_start_statement(text: str) -> bool:
+    """Cheap DD/ prefix check run before the full first-line regex."""
+    return text[2:3] == "/" and text[:2].isdigit()
 
 
 def _parse_date(dm_date_str: str, payment_date: date) -> date:
-    parsed_date = datetime.strptime(dm_date_str, "%d/%m").date()
+    # DD/MM is guaranteed by the line regex, so slice instead of strptime (which
+    # also rejects 29/02 since it parses against the default year 1900)
+    day, month = int(dm_date_str[:2]), int(dm_date_str[3:5])
     year = payment_date.year
-    if payment_date.month == 1 and parsed_date.month == 12:
+    if payment_date.month == 1 and month == 12:
         year -= 1
-    return parsed_date.replace(year)
+    return date(year, month, day)
@@ -1,17 +1,19 @@
-import re
 import unicodedata
 
+from finance_cli.utils import COMBINING_MARKS
+
+# 1.234,56 -> 1234.56 (drops spaces and thousands separators, swaps the decimal comma)
+_BRL_AMOUNT_TABLE = str.maketrans({" ": None, ".": None, ",": "."})
+
 
 def normalize_text(text: str) -> str:
     """Normalize text by removing accents, lowercasing, and stripping whitespace."""
-    normalized = unicodedata.normalize("NFKD", text)
-    normalized = "".join(
-        char for char in normalized if not unicodedata.combining(char)
-    ).lower()
-    return re.sub(r"\s+", "", normalized)
+    if text.isascii():
+        return "".join(text.split()).lower()
+    normalized = unicodedata.normalize("NFKD", text).translate(COMBINING_MARKS).lower()
+    return "".join(normalized.split())
 
 
 def parse_brl_amount(value: str) -> float:
     """Parse a BRL-formatted amount (1.234,56) into a float."""
-    cleaned = value.replace(" ", "").replace(".", "").replace(",", ".")
-    return float(cleaned)
+    return float(value.translate(_BRL_AMOUNT_TABLE))
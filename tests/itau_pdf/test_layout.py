@@ -0,0 +1,33 @@
+import unittest
+
+import fitz
+
+from itau_pdf.layout import iter_lines
+
+
+def _build_doc() -> fitz.Document:
+    doc = fitz.open()
+    for number in range(2):
+        page = doc.new_page(width=595, height=842)
+        if number == 0:
+            page.insert_text((40, 40), "Lançamentos: compras e saques")
+        page.insert_text((40, 80), f"0{number + 1}/01 LOJA {number} 10,00")
+        page.insert_text((40, 92), "DIVERSOS")
+    return doc
+
+
+class TestLayout(unittest.TestCase):
+
+    def test_iter_lines_reads_words_from_paired_textpages(self):
+        with _build_doc() as doc:
+            expected = [line.text for line in iter_lines(doc)]
+            # Pages and TextPages built while iterating the document, not from a stored page list
+            paired = [line.text for line in iter_lines((p, p.get_textpage()) for p in doc)]
+        self.assertEqual(
+            expected, ["01/01 LOJA 0 10,00", "DIVERSOS", "02/01 LOJA 1 10,00", "DIVERSOS"]
+        )
+        self.assertEqual(paired, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
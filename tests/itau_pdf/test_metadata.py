@@ -0,0 +1,27 @@
+import unittest
+
+from itau_pdf.metadata import _extract_last4, _extract_total
+
+
+class TestMetadata(unittest.TestCase):
+
+    def test_extract_total_prefers_pattern_priority_over_position(self):
+        # "Total da fatura" appears first, but "Total desta fatura" has priority
+        text = "Total da fatura\nR$ 10,00\nResumo\nTotal desta fatura\nR$ 1.234,56"
+        self.assertEqual(_extract_total(text), 1234.56)
+        text = "Total da fatura\n5,00\nO total da sua fatura é:\nR$ 99,90"
+        self.assertEqual(_extract_total(text), 99.90)
+
+    def test_extract_total_skips_previous_invoice(self):
+        text = "Total da fatura anterior\nR$ 50,00\nTotal da fatura\nR$ 75,10"
+        self.assertEqual(_extract_total(text), 75.10)
+        self.assertIsNone(_extract_total("Total da fatura anterior\nR$ 50,00"))
+
+    def test_extract_last4_returns_last_masked_card(self):
+        text = "Cartão XXXX.1234\nAdicional xxxx.9876\nfinal"
+        self.assertEqual(_extract_last4(text), "9876")
+        self.assertIsNone(_extract_last4("Cartão 1234"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -63,3 +63,11 @@ class TestStatements(unittest.TestCase):
 
         self.assertEqual(results[0].date, date(2024, 12, 20))
         self.assertEqual(results[1].date, date(2025, 1, 5))
+
+    def test_parse_lines_leap_day(self):
+        """Tests that 29/02 is accepted in leap years"""
+        payment_date = date(2024, 3, 10)
+        lines = [Line(text="29/02 LEAP DAY 10,00")]
+        results = list(parse_lines(iter(lines), payment_date))
+
+        self.assertEqual(results[0].date, date(2024, 2, 29))
@@ -12,6 +12,8 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(normalize_text("  Lançamentos: Compras  "), "lancamentos:compras")
         # Test complex unicode
         self.assertEqual(normalize_text("Açúcar e Café"), "acucarecafe")
+        # Test already decomposed input and uppercase accents
+        self.assertEqual(normalize_text("Cafe\u0301 PARCELAMENTO ÇÃO"), "cafeparcelamentocao")
 
     def test_parse_brl_amount(self):
         # Standard BRL format
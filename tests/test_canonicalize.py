@@ -10,3 +10,12 @@ def test_canonicalize_removes_installment_suffixes() -> None:
 
 def test_canonicalize_collapses_spaced_letters() -> None:
     assert canonicalize_description("A C L ODONTO") == "acl odonto"
+
+
+def test_canonicalize_strips_accents() -> None:
+    assert canonicalize_description("Padaria São João") == "padaria sao joao"
+
+
+def test_canonicalize_strips_marks_outside_the_basic_block() -> None:
+    # Combining marks for symbols and supplements, not just U+0300-U+036F
+    assert canonicalize_description("Cafe⃗ Ba᷀r") == "cafe bar"
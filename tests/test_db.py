@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import pytest
+
+from finance_cli.db import _itau_import_id, _parse_date
+
+
+def test_parse_date_day_first_layouts() -> None:
+    assert _parse_date("05/02/2024") == "2024-02-05"
+    assert _parse_date(" 05/02/24 ") == "2024-02-05"
+
+
+def test_parse_date_two_digit_year_pivot() -> None:
+    # Same pivot as strptime's %y: 00-68 -> 20xx, 69-99 -> 19xx
+    assert _parse_date("31/12/68") == "2068-12-31"
+    assert _parse_date("01/01/69") == "1969-01-01"
+
+
+def test_parse_date_iso() -> None:
+    assert _parse_date("2024-02-29") == "2024-02-29"
+
+
+def test_parse_date_falls_back_to_month_first() -> None:
+    assert _parse_date("12/31/2024") == "2024-12-31"
+
+
+def test_parse_date_single_digit_fields_use_strptime() -> None:
+    assert _parse_date("1/2/2024") == "2024-02-01"
+
+
+def test_parse_date_invalid() -> None:
+    assert _parse_date("29/02/2023") is None
+    assert _parse_date("not a date") is None
+
+
+def test_itau_import_id() -> None:
+    assert _itau_import_id("15/02/2025", "7") == "2025-FEB-7"
+    assert _itau_import_id("2025-12-01", "012") == "2025-DEC-12"
+
+
+def test_itau_import_id_invalid() -> None:
+    with pytest.raises(ValueError, match="Invalid payment date"):
+        _itau_import_id("31/02/2025", "1")
+    with pytest.raises(ValueError, match="Invalid index"):
+        _itau_import_id("15/02/2025", "x")
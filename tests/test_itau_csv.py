@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pytest
+
+from finance_cli.itau import check_total, write_csv_lines_idempotent
+
+
+def test_write_csv_lines_idempotent_skips_existing_ids(tmp_path) -> None:
+    output_path = tmp_path / "itau.csv"
+    rows = ["2024-FEB-1,01/02/24,,Coffee,-10.00", "2024-FEB-2,02/02/24,,Market,-5.00"]
+
+    assert write_csv_lines_idempotent(rows, output_path) == 2
+    assert write_csv_lines_idempotent(rows, output_path) == 0
+
+    lines = output_path.read_text(encoding="utf-8").splitlines()
+    assert lines == ["id,transaction_date,payment_date,description,amount,acc", *rows]
+
+
+def test_write_csv_lines_idempotent_appends_only_new_rows(tmp_path) -> None:
+    output_path = tmp_path / "itau.csv"
+    rows = ["2024-FEB-1,01/02/24,,Coffee,-10.00", "2024-FEB-2,02/02/24,,Market,-5.00"]
+
+    assert write_csv_lines_idempotent(rows[:1], output_path) == 1
+    assert write_csv_lines_idempotent(rows, output_path) == 1
+
+    lines = output_path.read_text(encoding="utf-8").splitlines()
+    assert lines == ["id,transaction_date,payment_date,description,amount,acc", *rows]
+
+
+def test_write_csv_lines_idempotent_without_headers(tmp_path) -> None:
+    output_path = tmp_path / "itau.csv"
+    rows = ["2024-FEB-1,01/02/24,,Coffee,-10.00"]
+
+    assert write_csv_lines_idempotent(rows, output_path, include_headers=False) == 1
+    assert write_csv_lines_idempotent(rows, output_path, include_headers=False) == 0
+    assert output_path.read_text(encoding="utf-8").splitlines() == rows
+
+
+def test_check_total_ignores_trailing_columns() -> None:
+    rows = ["2024-FEB-1,01/02/24,,Coffee,10.00,acc,extra", "2024-FEB-2,02/02/24,,Market,5.50"]
+    check_total(rows, 15.5)
+    with pytest.raises(ValueError, match="Error validating totals"):
+        check_total(rows, 10.0)
+
+
+def test_write_csv_lines_idempotent_quotes_like_csv_writer(tmp_path) -> None:
+    output_path = tmp_path / "itau.csv"
+    rows = ['2024-FEB-1,01/02/24,,Bar "Zé",-10.00']
+
+    assert write_csv_lines_idempotent(rows, output_path, include_headers=False) == 1
+    assert write_csv_lines_idempotent(rows, output_path, include_headers=False) == 0
+    expected = '2024-FEB-1,01/02/24,,"Bar ""Zé""",-10.00\r\n'
+    assert output_path.read_bytes().decode("utf-8") == expected
+
+
+def test_write_csv_lines_idempotent_dedupes_quoted_rows(tmp_path) -> None:
+    output_path = tmp_path / "itau.csv"
+    rows = ['"x",01/02/24,,Coffee,-10.00', "2024-FEB-2,02/02/24,,Bar\nTab,-5.00", "id,,,Odd,-1.00"]
+
+    assert write_csv_lines_idempotent(rows, output_path) == 3
+    assert write_csv_lines_idempotent(rows, output_path) == 0
@@ -3,17 +3,22 @@ from __future__ import annotations
 import os
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
+from notion_client import APIResponseError
 
+from finance_cli import notion
 from finance_cli.notion import (
     NotionConfig,
     _create_notion_page,
     _get_notion_client,
     _get_notion_config,
+    _RateLimiter,
     _update_notion_page,
     batch_upsert_pages,
     deprecated_batch_create_pages,
     get_notion_page,
+    iter_notion_pages,
     query_notion_pages,
     upsert_notion_page,
 )
@@ -29,6 +34,20 @@ def mock_env_vars(monkeypatch):
     _get_notion_client.cache_clear()
 
 
+@pytest.fixture(autouse=True)
+def no_rate_limit(monkeypatch):
+    """Fixture to keep the shared Notion rate limiter from slowing tests down."""
+    monkeypatch.setattr(notion, "_rate_limiter", _RateLimiter(rate=1000.0, burst=1000))
+
+
+def _rate_limited_error(retry_after: str) -> APIResponseError:
+    # Built without __init__, whose signature differs across notion-client versions
+    error = APIResponseError.__new__(APIResponseError)
+    error.status = 429
+    error.headers = httpx.Headers({"Retry-After": retry_after})
+    return error
+
+
 @pytest.fixture
 def mock_notion_client():
     """Fixture to provide a mocked Notion client."""
@@ -116,6 +135,21 @@ def test_query_notion_pages_with_pagination(mock_env_vars, mock_notion_client):
     assert mock_notion_client.databases.query.call_count == 2
 
 
+def test_iter_notion_pages_fetches_lazily(mock_env_vars, mock_notion_client):
+    """Test iter_notion_pages only requests the next batch once the current one is consumed."""
+    mock_notion_client.databases.query.side_effect = [
+        {"results": [{"id": "page1"}], "has_more": True, "next_cursor": "cursor123"},
+        {"results": [{"id": "page2"}], "has_more": False},
+    ]
+
+    pages = iter_notion_pages()
+
+    assert next(pages)["id"] == "page1"
+    assert mock_notion_client.databases.query.call_count == 1
+    assert [page["id"] for page in pages] == ["page2"]
+    assert mock_notion_client.databases.query.call_count == 2
+
+
 def test_upsert_notion_page_create(mock_env_vars, mock_notion_client):
     """Test upsert_notion_page creates a new page when page_id is None."""
     mock_notion_client.pages.create.return_value = {"id": "new_page_id"}
@@ -170,6 +204,50 @@ def test_batch_upsert_pages_with_failures(mock_env_vars, mock_notion_client):
     assert result["failed"] == 1
 
 
+def test_batch_upsert_pages_counts_concurrent_results(mock_env_vars, mock_notion_client):
+    """Test batch_upsert_pages pairs each concurrent result with its own entry."""
+
+    def create(parent, properties):
+        if properties["fail"]:
+            raise Exception("API Error")
+        return {"id": "new_id"}
+
+    mock_notion_client.pages.create.side_effect = create
+
+    entries = [(None, {"fail": i % 3 == 0}) for i in range(10)]
+    entries += [(f"page_{i}", {}) for i in range(5)]
+
+    result = batch_upsert_pages(entries)
+
+    assert result == {"created": 6, "updated": 5, "failed": 4}
+    assert mock_notion_client.pages.create.call_count == 10
+    assert mock_notion_client.pages.update.call_count == 5
+
+
+def test_create_notion_page_retries_rate_limited(mock_env_vars, mock_notion_client):
+    """Test _create_notion_page waits for Retry-After and retries on 429."""
+    mock_notion_client.pages.create.side_effect = [_rate_limited_error("2"), {"id": "new_page_id"}]
+
+    with patch("finance_cli.notion.time.sleep") as mock_sleep:
+        result = _create_notion_page({})
+
+    assert result == "new_page_id"
+    assert mock_notion_client.pages.create.call_count == 2
+    mock_sleep.assert_called_once_with(2.0)
+
+
+def test_rate_limiter_waits_when_burst_is_spent():
+    """Test _RateLimiter sleeps once its burst tokens run out."""
+    with patch("finance_cli.notion.time.sleep") as mock_sleep, \
+            patch("finance_cli.notion.time.monotonic", side_effect=[0.0, 0.0, 0.0, 0.0, 0.5]):
+        limiter = _RateLimiter(rate=2.0, burst=2)
+        limiter.acquire()
+        limiter.acquire()
+        limiter.acquire()
+
+    mock_sleep.assert_called_once_with(0.5)
+
+
 def test_create_notion_page_success(mock_env_vars, mock_notion_client):
     """Test _create_notion_page returns new page_id on success."""
     mock_notion_client.pages.create.return_value = {"id": "new_page_id"}
@@ -51,3 +51,20 @@ def test_parse_nubank_chk(tmp_path: Path) -> None:
     result = pd.read_csv(output_path)
     assert result.loc[0, "transaction_date"] == "2025-01-02"
     assert result.loc[0, "amount"] == 1500.0
+
+
+def test_parse_nubank_iso_dates(tmp_path: Path) -> None:
+    input_path = tmp_path / "nubank_iso.csv"
+
+    pd.DataFrame(
+        {
+            "date": ["2025-01-02", "2025-12-31"],
+            "title": ["Coffee", "Groceries"],
+            "amount": [10.0, 20.5],
+        }
+    ).to_csv(input_path, index=False)
+
+    output = parse_nubank_csv(input_path, template="nubank_cc")
+
+    result = pd.read_csv(output)
+    assert list(result["transaction_date"]) == ["2025-01-02", "2025-12-31"]